@@ -33,8 +33,17 @@ col2.metric("Wind", "9 mph", "-8%")
 col3.metric("Humidity", "86%", "4%")
 
 # Row B
-seattle_weather = pd.read_csv('https://raw.githubusercontent.com/tvst/plost/master/data/seattle-weather.csv', parse_dates=['date'])
-stocks = pd.read_csv('https://raw.githubusercontent.com/dataprofessor/data/master/stocks_toy.csv')
+# Only the columns referenced by the charts and sidebar options are loaded;
+# add to these lists when a chart starts using another column.
+SEATTLE_WEATHER_COLS = ['date', 'temp_min', 'temp_max']
+STOCKS_COLS = ['company', 'q2', 'q3']
+
+@st.experimental_memo(ttl=24*3600)
+def load_csv(url, usecols=None, parse_dates=None):
+    return pd.read_csv(url, usecols=usecols, parse_dates=parse_dates)
+
+seattle_weather = load_csv('https://raw.githubusercontent.com/tvst/plost/master/data/seattle-weather.csv', usecols=SEATTLE_WEATHER_COLS, parse_dates=['date'])
+stocks = load_csv('https://raw.githubusercontent.com/dataprofessor/data/master/stocks_toy.csv', usecols=STOCKS_COLS)
 
 c1, c2 = st.columns((7,3))
 with c1: